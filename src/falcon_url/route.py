@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import Any, Callable, ClassVar, Final, Iterator, Mapping, Self
 
 from .url import Url
@@ -68,13 +69,14 @@ class Route:
     ```
     """
 
-    __slots__ = ("segments",)
+    __slots__ = ("_as_url", "segments")
 
     def __init__(self, *segments: str | RouteSegment):
         self.segments: Final = tuple(
             seg if isinstance(seg, RouteSegment) else RouteSegment(seg)
             for seg in segments
         )
+        self._as_url: Callable[[dict[str, Any]], Url] | None = None
 
     def __str__(self) -> str:
         return "/".join([str(seg) for seg in self.segments])
@@ -105,6 +107,10 @@ class Route:
 
     def as_url(self, **params: Any) -> Url:
         """Resolve route to the URL substituting parameters from the provided keyword arguments"""
+        as_url = self._as_url
+        if as_url is not None:
+            return as_url(params)
+
         segments: list[str] = []
 
         for seg in self.segments:
@@ -119,6 +125,40 @@ class Route:
 
         return Url(*segments)
 
+    def _compile(self) -> None:
+        """Generate the straight-line function resolving this route to the URL.
+        Static parts are precomputed, so there is no per-call walk
+        over the segments and parts. Generating is costly, so it's done only
+        for the routes registered in router, not for the every ad-hoc route"""
+        if self._as_url is not None:
+            return
+
+        scope: dict[str, Any] = {"Url": Url}
+        args: list[str] = []
+
+        for seg in self.segments:
+            if not seg._get_params():
+                # static segments are interned, so the equal segments of all urls
+                # share the same str object (and its cached hash)
+                name = f"_segment_{len(scope)}"
+                scope[name] = sys.intern(str(seg))
+                args.append(name)
+                continue
+
+            exprs: list[str] = []
+            for part in seg.parts:
+                if isinstance(part, str):
+                    exprs.append(repr(part))
+                else:
+                    name = f"_interpolate_{len(scope)}"
+                    scope[name] = part.interpolate
+                    exprs.append(f"{name}(params.pop({part.id!r}))")
+            args.append(" + ".join(exprs) or '""')
+
+        src = f"def as_url(params):\n    return Url({', '.join(args)})\n"
+        exec(compile(src, "<route>", "exec"), scope)
+        self._as_url = scope["as_url"]
+
     @classmethod
     def root(cls) -> Self:
         return cls("")
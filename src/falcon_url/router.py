@@ -1,7 +1,13 @@
-from typing import Any, Awaitable, Callable, Final, Protocol, final
+import inspect
+from functools import lru_cache
+from inspect import Parameter
+from itertools import chain
+from types import FunctionType, MethodType
+from typing import Any, Awaitable, Callable, Final, NamedTuple, Protocol, final
+from weakref import WeakKeyDictionary
 
 from falcon import Request, Response
-from falcon.routing.compiled import CompiledRouter
+from falcon.routing.compiled import CompiledRouter, CompiledRouterNode
 
 from .route import BoundRoute, Route
 
@@ -59,6 +65,8 @@ class CatchallResource:
 _CATCHALL_RESOURCE: Final = CatchallResource()
 
 
+# routes are immutable, so the parsed one may be safely shared
+@lru_cache(maxsize=1024)
 def _parse_template(template: str) -> Route:
     # do not import until really required
     from .template import parse_template
@@ -66,52 +74,120 @@ def _parse_template(template: str) -> Route:
     return parse_template(template)
 
 
-def _validate_responder(meth: str, handler: Callable[..., Any], route: Route) -> None:
-    import inspect
-    from inspect import Parameter
+class _Param(NamedTuple):
+    name: str
+    has_default: bool
+    anno: Any
+
+
+class _Signature(NamedTuple):
+    positional: tuple[_Param, ...]
+    kwonly: tuple[_Param, ...]
+
+
+_NO_ANNO: Final = object()
+
+# probed signatures of handler functions. weakly keyed, so the handlers
+# (and their closures) are not kept alive by the cache
+_PROBED: Final[WeakKeyDictionary[FunctionType, _Signature | None]] = WeakKeyDictionary()
+
+
+def _probe_function(func: FunctionType) -> _Signature | None:
+    """Extract signature of the plain function right from its code object.
+    This is way faster than inspect.signature. Returns None if function
+    needs the full inspect machinery (decorated, stringified annotations, etc.)"""
+    if hasattr(func, "__wrapped__") or hasattr(func, "__signature__"):
+        return None
+    annos = func.__annotations__
+    if any(isinstance(anno, str) for anno in annos.values()):
+        return None
+
+    code = func.__code__
+    nargs = code.co_argcount
+    names = code.co_varnames
+    first_default = nargs - len(func.__defaults__ or ())
+    kwdefaults = func.__kwdefaults__ or {}
+
+    positional = tuple(
+        _Param(name, i >= first_default, annos.get(name, _NO_ANNO))
+        for i, name in enumerate(names[:nargs])
+    )
+    kwonly = tuple(
+        _Param(name, name in kwdefaults, annos.get(name, _NO_ANNO))
+        for name in names[nargs : nargs + code.co_kwonlyargcount]
+    )
+    return _Signature(positional, kwonly)
+
+
+def _inspect_signature(handler: Callable[..., Any]) -> _Signature:
+    params = inspect.signature(handler, eval_str=True).parameters.values()
 
-    sig = inspect.signature(handler, eval_str=True)
-    params = sig.parameters.values()
+    def cook(param: Parameter) -> _Param:
+        return _Param(
+            param.name,
+            param.default is not Parameter.empty,
+            _NO_ANNO if param.annotation is Parameter.empty else param.annotation,
+        )
+
+    return _Signature(
+        tuple(
+            cook(p)
+            for p in params
+            if p.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+        ),
+        tuple(cook(p) for p in params if p.kind == Parameter.KEYWORD_ONLY),
+    )
+
+
+def _get_signature(handler: Callable[..., Any]) -> _Signature:
+    func = handler.__func__ if isinstance(handler, MethodType) else handler
+    sig = None
+    if isinstance(func, FunctionType):
+        try:
+            sig = _PROBED[func]
+        except KeyError:
+            sig = _PROBED[func] = _probe_function(func)
+    if sig is not None and func is not handler:
+        # bound method, drop the self
+        sig = sig._replace(positional=sig.positional[1:]) if sig.positional else None
+    if sig is None:
+        sig = _inspect_signature(handler)
+    return sig
+
+
+def _validate_responder(meth: str, handler: Callable[..., Any], route: Route) -> None:
+    sig = _get_signature(handler)
 
     name = handler.__name__
     if not name.startswith("on_"):
         raise ValueError("name must begin with on_")
 
     route_args = route._get_params()
-    # first two params are req, resp
-    # last param may be **kwargs
-    req, resp, *responder_params = params
-
-    # req, resp should be positional or positional-or-keyword
-    if not (
-        req.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
-        and req.default == Parameter.empty
-    ):
+    # first two params are req, resp. they should be positional or
+    # positional-or-keyword. the rest positional params (if any) are ignored
+    if not sig.positional or sig.positional[0].has_default:
         raise TypeError("wrong req parameter")
 
-    if not (
-        resp.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
-        and resp.default == Parameter.empty
-    ):
+    if len(sig.positional) < 2 or sig.positional[1].has_default:
         raise TypeError("wrong resp parameter")
 
     # route arguments are keyword-only
-    responder_params = [r for r in responder_params if r.kind == Parameter.KEYWORD_ONLY]
+    params_by_name = {param.name: param for param in sig.kwonly}
 
     # the args and params must match exactly, though may be in different order
     argset = {arg.id for arg in route_args}
-    parset = {param.name for param in responder_params}
-    diff = argset ^ parset
-    if diff:
+    parset = params_by_name.keys()
+    if len(argset) != len(parset) or argset != parset:
+        diff = argset ^ parset
         raise ValueError(f"no matching argument and keyword-parameter: {sorted(diff)}")
 
     for arg in route_args:
-        param = next(p for p in responder_params if p.name == arg.id)
+        param = params_by_name[arg.id]
 
-        if param.default != Parameter.empty:
+        if param.has_default:
             raise TypeError(f"parameter {param.name} must have no default value")
-        anno = param.annotation
-        if anno == Parameter.empty:
+        anno = param.anno
+        if anno is _NO_ANNO:
             raise ValueError(f"missing type annotation for parameter {param.name}")
         if anno != arg._anno:
             raise ValueError(
@@ -130,6 +206,12 @@ class Router[TReq: Request, TResp: Response, TRet: (None, Awaitable[None])](
     def __init__(self, *, strict: bool = False) -> None:
         super().__init__()
         self._strict = strict
+        # fully static routes by their path (sans the leading slash)
+        self._static_routes: dict[str, CompiledRouterNode] = {}
+        # successfully validated (function, bound instance, route) by ids. bound
+        # methods are recreated on each access, so they are keyed by parts.
+        # the objects are kept to guarantee the ids are not reused
+        self._validated: dict[tuple[int, int, int], tuple[object, object, Route]] = {}
 
     def add_route[**P](  # type: ignore[override]
         self,
@@ -146,9 +228,10 @@ class Router[TReq: Request, TResp: Response, TRet: (None, Awaitable[None])](
         if self._strict:
             methods = super().map_http_methods(resource, **kwargs)
             for http_method, responder in methods.items():
-                _validate_responder(http_method, responder, route_obj)
+                self._validate_responder(http_method, responder, route_obj)
 
         super().add_route(str(route_obj), resource, **kwargs)
+        route_obj._compile()
         return BoundRoute[P](route_obj)
 
     def add[**P](
@@ -180,35 +263,53 @@ class Router[TReq: Request, TResp: Response, TRet: (None, Awaitable[None])](
         if not template.startswith("/"):
             raise ValueError(f"route must begin with slash ({template})")
 
-        # collect all handlers from explicit args, then group by resources
-        by_meth = {
-            "GET": GET,
-            "POST": POST,
-            "PUT": PUT,
-            "DELETE": DELETE,
-            "OPTIONS": OPTIONS,
-            **responders,
-        }
-
+        # group handlers by resources
         by_resource: dict[object, dict[str, Responder[TReq, TResp, Any, P]]] = {}
-        for http_method, responder in by_meth.items():
-            if responder:
-                resource: object = getattr(responder, "__self__", _CATCHALL_RESOURCE)
-                by_resource.setdefault(resource, {})[http_method] = responder
+        for http_method, responder in chain(
+            (
+                ("GET", GET),
+                ("POST", POST),
+                ("PUT", PUT),
+                ("DELETE", DELETE),
+                ("OPTIONS", OPTIONS),
+            ),
+            responders.items(),
+        ):
+            if responder is None:
+                continue
+            resource: object = getattr(responder, "__self__", _CATCHALL_RESOURCE)
+            resps = by_resource.get(resource)
+            if resps is None:
+                resps = by_resource[resource] = {}
+            resps[http_method] = responder
 
         for resource, resps in by_resource.items():
             for http_method, responder in resps.items():
                 if self._strict:
                     try:
-                        _validate_responder(http_method, responder, route_obj)
+                        self._validate_responder(http_method, responder, route_obj)
                     except Exception as e:
                         raise ValueError(
                             f"Handler {responder} validation error: {e}"
                         ) from e
             super().add_route(template, resource, _cooked=resps)
 
+        route_obj._compile()
         return BoundRoute[P](route_obj)
 
+    def _validate_responder(
+        self, meth: str, handler: Callable[..., Any], route: Route
+    ) -> None:
+        if isinstance(handler, MethodType):
+            func, obj = handler.__func__, handler.__self__
+        else:
+            func, obj = handler, None
+        key = (id(func), id(obj), id(route))
+        if key in self._validated:
+            return
+        _validate_responder(meth, handler, route)
+        self._validated[key] = (func, obj, route)
+
     def map_http_methods(
         self,
         resource: object,
@@ -221,9 +322,50 @@ class Router[TReq: Request, TResp: Response, TRet: (None, Awaitable[None])](
             return _cooked
         return super().map_http_methods(resource, **kwargs)
 
+    def find(
+        self, uri: str, req: Request | None = None
+    ) -> tuple[object, dict[str, Any], dict[str, Any], str | None] | None:
+        # static routes are resolved with the single dict lookup. falcon tries
+        # the static segments first, so the full static match always wins anyway
+        path = uri.lstrip("/")
+        params: dict[str, Any] = {}
+        node = self._static_routes.get(path)
+        if node is None:
+            # same as CompiledRouter.find(), sans the repeated strip
+            node = self._find(
+                path.split("/"),
+                self._return_values,
+                self._patterns,
+                self._converters,
+                params,
+            )
+            if node is None:
+                return None
+        return node.resource, node.method_map or {}, params, node.uri_template
+
+    def _compile(self) -> Callable[..., Any]:
+        static: dict[str, CompiledRouterNode] = {}
+        stack = [(node, node.raw_segment) for node in self._roots if not node.is_var]
+        while stack:
+            node, path = stack.pop()
+            if node.resource is not None:
+                static[path] = node
+            stack.extend(
+                (child, f"{path}/{child.raw_segment}")
+                for child in node.children
+                if not child.is_var
+            )
+        # index is replaced only if the tree compiles fine
+        finder = super()._compile()
+        self._static_routes = static
+        return finder
+
     def compile(self) -> None:
-        # trigger compile
-        self.find("")
+        # falcon defers compiling the routes tree until the first find(), so
+        # adding routes is cheap. compile explicitly once all routes are added
+        # to save the first request from the compile latency.
+        # bypass the static routes lookup, it may be stale until recompiled
+        super().find("")
 
     @classmethod
     def register_with_inspect(cls) -> None:
@@ -1,4 +1,6 @@
 import html
+import string
+from functools import lru_cache
 from typing import Final, Iterable, Sequence
 from urllib.parse import quote, urlencode
 
@@ -23,12 +25,37 @@ def _make_qs(args: Iterable[tuple[str, QArg | None]]) -> list[tuple[str, str]]:
         if isinstance(v, (str, int, float)):
             query.append((k, _tostr(v)))
         else:
-            if all(isinstance(elt, (str, int, float)) for elt in v):
-                query.extend([(k, _tostr(elt)) for elt in v])
+            # validate and convert in a single pass. iterable is skipped
+            # altogether if any of the elements is bad
+            start = len(query)
+            for elt in v:
+                if not isinstance(elt, (str, int, float)):
+                    del query[start:]
+                    break
+                query.append((k, _tostr(elt)))
 
     return query
 
 
+# same safe chars as in urllib.parse.quote with default safe="/"
+_SAFE_CHARS: Final = string.ascii_letters + string.digits + "_.-~/"
+
+
+def _quote(s: str) -> str:
+    # most strings are already safe. they are returned as is, skipping the
+    # quote() setup
+    if not s.rstrip(_SAFE_CHARS):
+        return s
+    return quote(s)
+
+
+# segments are mostly static parts of routes, reused across many urls.
+# slash is kept safe since root and path params may contain slashes
+@lru_cache(maxsize=4096)
+def _quote_segment(segment: str) -> str:
+    return _quote(segment)
+
+
 class Url:
     """Immutable object representing URL. Manipulating URL components produces another URLs.
     The division operator is overloaded to allow composing URL ala pathlib.Path:
@@ -37,7 +64,16 @@ class Url:
     ```
     """
 
-    __slots__ = ("fragment", "location", "query", "root", "segments")
+    __slots__ = (
+        "_cached_hash",
+        "_cached_str",
+        "_query_str",
+        "fragment",
+        "location",
+        "query",
+        "root",
+        "segments",
+    )
 
     def __init__(
         self,
@@ -52,24 +88,57 @@ class Url:
         self.segments: Final = segments
         self.query: Final = query
         self.fragment: Final = fragment
+        # query is frozen, so it's encoded once
+        self._query_str = urlencode(query, doseq=True) if query else ""
+        self._cached_str: str | None = None
+        self._cached_hash: int | None = None
+
+    @classmethod
+    def _from_slots(
+        cls,
+        root: str | None,
+        segments: tuple[str, ...],
+        location: str | None,
+        query: Sequence[tuple[str, str]] | None,
+        query_str: str,
+        fragment: str | None,
+    ) -> "Url":
+        """Fast constructor for the derived urls. Takes segments tuple and
+        the already encoded query as is"""
+        url = cls.__new__(cls)
+        url.root = root  # type: ignore[misc]
+        url.segments = segments  # type: ignore[misc]
+        url.location = location  # type: ignore[misc]
+        url.query = query  # type: ignore[misc]
+        url.fragment = fragment  # type: ignore[misc]
+        url._query_str = query_str
+        url._cached_str = None
+        url._cached_hash = None
+        return url
 
-    # cache ?
     def as_str(self) -> str:
         """Render as quoted (percent-encoded) string"""
-        segments: Iterable[str] = self.segments
+        # url is immutable, so it's rendered once and reused
+        cached = self._cached_str
+        if cached is not None:
+            return cached
+
+        segments = self.segments
         if self.root is not None:
-            segments = [self.root, *segments]
-        url = "/".join(segments)
-        url = quote(url)
-        if self.location:
-            url = self.location + url
-
-        if self.query:
-            qs = urlencode(self.query, doseq=True)
-            if qs:
-                url += f"?{qs}"
-        if self.fragment is not None:
-            url += f"#{quote(self.fragment)}"
+            segments = (self.root, *segments)
+        url = "/".join(map(_quote_segment, segments))
+
+        # most urls are the internal app paths. the rest parts are rare
+        if self.location or self._query_str or self.fragment is not None:
+            if self.location:
+                url = self.location + url
+
+            if self._query_str:
+                url += f"?{self._query_str}"
+            if self.fragment is not None:
+                url += f"#{_quote(self.fragment)}"
+
+        self._cached_str = url
         return url
 
     def as_html(self) -> str:
@@ -80,60 +149,76 @@ class Url:
         segments = self.segments[index_or_slice]
         if not isinstance(segments, tuple):
             segments = (segments,)
-        return Url(
+        return Url._from_slots(
             self.root,
-            *segments,
-            location=self.location,
-            query=self.query,
-            fragment=self.fragment,
+            segments,
+            self.location,
+            self.query,
+            self._query_str,
+            self.fragment,
         )
 
     def __bytes__(self) -> bytes:
         return self.as_str().encode("ascii")
 
     def __truediv__(self, right: str) -> "Url":
-        return Url(
+        return Url._from_slots(
             self.root,
-            *self.segments,
-            right,
-            location=self.location,
-            query=self.query,
-            fragment=self.fragment,
+            (*self.segments, right),
+            self.location,
+            self.query,
+            self._query_str,
+            self.fragment,
         )
 
     def __rtruediv__(self, left: str) -> "Url":
-        return Url(
+        return Url._from_slots(
             self.root,
-            left,
-            *self.segments,
-            location=self.location,
-            query=self.query,
-            fragment=self.fragment,
+            (left, *self.segments),
+            self.location,
+            self.query,
+            self._query_str,
+            self.fragment,
         )
 
-    # hash is inprecise, since query key-values are hashed as is without processing.
+    # hash is inprecise, since components are hashed as is without rendering.
     # But good enough for practical purposes, that is objects with same hash should compare equal
     def __hash__(self) -> int:
-        return hash(
-            (self.location, self.root, self.segments, self.query, self.fragment)
-        )
+        cached = self._cached_hash
+        if cached is None:
+            cached = hash(
+                (self.location, self.root, self.segments, self._query_str, self.fragment)
+            )
+            self._cached_hash = cached
+        return cached
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Url):
             return NotImplemented
         if other is self:
             return True
+        # same components surely render the same. otherwise compare the rendered
+        # strings, since different components still may produce the same url
+        if (
+            self.segments == other.segments
+            and self.root == other.root
+            and self.location == other.location
+            and self._query_str == other._query_str
+            and self.fragment == other.fragment
+        ):
+            return True
         return self.as_str() == other.as_str()
 
     def with_location(self, location: str) -> "Url":
         """Make new URL with the location changed. Location is schema, netloc and port (
         for example, "http://www.example.com"). Location is NOT quoted"""
-        return Url(
+        return Url._from_slots(
             self.root,
-            *self.segments,
-            location=location,
-            query=self.query,
-            fragment=self.fragment,
+            self.segments,
+            location,
+            self.query,
+            self._query_str,
+            self.fragment,
         )
 
     def with_query(self, **keyvals: QArg | None) -> "Url":
@@ -148,35 +233,38 @@ class Url:
         ```
         """
         qs = _make_qs(keyvals.items())
-        return Url(
+        return Url._from_slots(
             self.root,
-            *self.segments,
-            location=self.location,
-            query=qs,
-            fragment=self.fragment,
+            self.segments,
+            self.location,
+            qs,
+            urlencode(qs, doseq=True),
+            self.fragment,
         )
 
     def with_fragment(self, fragment: str) -> "Url":
         """Make new URL with the fragment (aka #hash) changed. Fragment should not include #,
         it would be added automatically."""
-        return Url(
+        return Url._from_slots(
             self.root,
-            *self.segments,
-            location=self.location,
-            query=self.query,
-            fragment=fragment,
+            self.segments,
+            self.location,
+            self.query,
+            self._query_str,
+            fragment,
         )
 
     def with_root(self, root: str) -> "Url":
         """Make new URL with the root prefix changed. Root prefix may contain slashes.
         This is intended for rebasing URL to the different subpath via WSGI SCRIPT_NAME.
         """
-        return Url(
+        return Url._from_slots(
             root,
-            *self.segments,
-            location=self.location,
-            query=self.query,
-            fragment=self.fragment,
+            self.segments,
+            self.location,
+            self.query,
+            self._query_str,
+            self.fragment,
         )
 
     __str__ = as_str
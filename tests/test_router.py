@@ -2,13 +2,17 @@
 import datetime
 import uuid
 from typing import Any
+from urllib.parse import quote
 
 import falcon
 import falcon.inspect
 import pytest
+from falcon.routing.compiled import CompiledRouter
 
+import falcon_url.router
 from falcon_url import Route, Router, RoutesCollection, Url, param
 from falcon_url.template import ArgParseError
+from falcon_url.url import _quote
 
 
 def test_int():
@@ -107,6 +111,11 @@ def test_route_query():
         == "/foo/bar/1/12?k1=true&k3=false&q=333&f=444&b=1&b=2&b=3&b=4&b=bla"
     )
 
+    assert (
+        str(Url("").with_query(a=(i for i in (1, 2)), b=[1, object()], c="x"))  # type: ignore
+        == "?a=1&a=2&c=x"
+    )
+
 
 def test_route_frag():
     route = Route("") / "foo" / "bar" / param.Str("str1") / param.Int("int1")
@@ -358,8 +367,15 @@ def test_validate():
     def on_post2(req: Any, resp: Any, *, foo: int, bla: float, rest: str):
         return None
 
+    # stringified annotations are resolved via the inspect
+    def on_get_str_anno(req: Any, resp: Any, *, foo: "str", dt: "datetime.datetime"):
+        return None
+
     router = Router(strict=True)
     router.add(Route("") / "base" / {"foo"} / {"dt": datetime.datetime}, POST=on_get1)
+    router.add(
+        Route("") / "base" / {"foo"} / {"dt": datetime.datetime}, POST=on_get_str_anno
+    )
     router.add(
         Route("") / "base" / {"foo"} / {"dt": datetime.datetime},
         POST=on_get1_with_mw_injected,
@@ -495,3 +511,181 @@ def test_url_methods():
     assert str(url[1].with_root("api")) == "api/bar"
     assert str(url[-1].with_root("api")) == "api/12"
     assert str(url[::-1].with_root("api")) == "api/12/1/bar/foo"
+
+
+def test_url_cache():
+    url = Url("", "foo", "b ar").with_fragment("x")
+    s = url.as_str()
+    assert s == "/foo/b%20ar#x"
+    assert url.as_str() is s
+    assert str(url) is s
+    assert hash(url) == hash(url)
+    assert url == Url("", "foo", "b ar", fragment="x")
+
+
+def test_route_as_url():
+    def on_get(req: Any, resp: Any, *, a: int, b: str):
+        return None
+
+    route = Route("") / "it's" / ('"' + param.Int("a") + "-" + param.Str("b")) / ""
+    # ad-hoc route is resolved by walking segments, registered one is compiled
+    for registered in (False, True):
+        if registered:
+            Router().add(route, GET=on_get)
+        assert (route._as_url is not None) == registered
+        assert str(route.as_url(a=1, b="x", extra=2)) == "/it%27s/%221-x/"
+        with pytest.raises(KeyError):
+            route.as_url(a=1)
+
+    empty = Route()
+    with pytest.raises(TypeError):
+        empty.as_url()
+    empty._compile()
+    with pytest.raises(TypeError):
+        empty.as_url()
+
+
+def test_static_routes():
+    def on_get(req: Any, resp: Any, **kwargs: Any):
+        return None
+
+    router = Router()
+    for template in (
+        "/",
+        "/foo",
+        "/foo/bar",
+        "/foo/bar/",
+        "/foo/{x}",
+        "/foo/{x}/baz",
+        "/files/{rest:path}",
+        "/files/static",
+        "/a{x}/b",
+        "/ab/b",
+    ):
+        router.add(template, GET=on_get)
+    router.compile()
+
+    for uri in (
+        "/",
+        "",
+        "/foo",
+        "//foo",
+        "/foo/",
+        "/foo/bar",
+        "/foo/bar/",
+        "/foo/qux",
+        "/foo/bar/baz",
+        "/files/static",
+        "/files/static/more",
+        "/ab/b",
+        "/ac/b",
+        "/nope",
+    ):
+        res = router.find(uri)
+        assert res == CompiledRouter.find(router, uri)
+
+    assert router.find("/foo/bar")[-1] == "/foo/bar"  # type: ignore
+    assert router.find("/files/static")[-1] == "/files/static"  # type: ignore
+
+    # recompile is not masked by the static routes
+    router.add("/a/{x}", GET=on_get)
+    router.compile()
+    assert router._find != router._compile_and_find
+    assert router.find("/a/1") == CompiledRouter.find(router, "/a/1")
+
+
+def test_url_eq():
+    assert Url("", "a", "b") == Url("", "a", "b")
+    assert Url("", "a", "b") == Url(None, "", "a/b")
+    assert Url("", "a").with_query() == Url("", "a")
+    assert Url("", "a") != Url("", "b")
+
+
+def test_url_query_hash():
+    url = Url("", "foo").with_query(a=1, b=[2, 3])
+    same = Url("", "foo", query=[("a", "1"), ("b", "2"), ("b", "3")])
+    assert url == same
+    assert hash(url) == hash(same)
+    assert {url: 1}[same] == 1
+    assert str(url / "bar") == "/foo/bar?a=1&b=2&b=3"
+
+
+def test_validate_cached(monkeypatch: pytest.MonkeyPatch):
+    calls: list[Any] = []
+    validate = falcon_url.router._validate_responder
+
+    def counting_validate(meth: str, handler: Any, route: Route):
+        calls.append(handler)
+        validate(meth, handler, route)
+
+    monkeypatch.setattr(falcon_url.router, "_validate_responder", counting_validate)
+
+    def on_get(req: Any, resp: Any, *, foo: str):
+        return None
+
+    def on_bad(req: Any, resp: Any, *, bar: str):
+        return None
+
+    class Resource:
+        def on_get(self, req: Any, resp: Any, *, foo: str):
+            return None
+
+    r = Resource()
+    route = Route("") / "base" / {"foo"}
+    router = Router(strict=True)
+
+    # same function
+    router.add(route, GET=on_get, POST=on_get)
+    router.add(route, PUT=on_get)
+    assert len(calls) == 1
+
+    # same bound method, though recreated on each access
+    router.add(route, GET=r.on_get, POST=r.on_get)
+    router.add(route, PUT=r.on_get)
+    assert len(calls) == 2
+
+    # same method bound to another instance
+    router.add(route, GET=Resource().on_get)
+    assert len(calls) == 3
+
+    # same function for another route
+    router.add(Route("") / "face" / {"foo"}, GET=on_get)
+    assert len(calls) == 4
+
+    # failures are not cached
+    for _ in range(2):
+        with pytest.raises(ValueError, match="no matching argument"):
+            router.add(route, GET=on_bad)
+    assert len(calls) == 6
+
+
+def test_quote():
+    for s in (
+        *(chr(c) for c in range(128)),
+        "".join(chr(c) for c in range(128)),
+        "",
+        "some-slug_value.~/x",
+        "Я",
+        "a Я/Ж,",
+        "é\U0001f600",
+    ):
+        assert _quote(s) == quote(s)
+
+
+def test_static_routes_failed_compile(monkeypatch: pytest.MonkeyPatch):
+    def on_get(req: Any, resp: Any):
+        return None
+
+    router = Router()
+    router.add("/a", GET=on_get)
+    router.compile()
+    static = router._static_routes
+
+    def broken_compile(self: CompiledRouter):
+        raise RuntimeError("broken")
+
+    router.add("/b", GET=on_get)
+    monkeypatch.setattr(CompiledRouter, "_compile", broken_compile)
+    with pytest.raises(RuntimeError):
+        router.compile()
+    assert router._static_routes is static